@@ -6,76 +6,311 @@ This script converts Word documents to Markdown format and validates that all
 inline references are included in the document's reference list.
 
 Requirements:
-    pip install python-docx mammoth
+    pip install python-docx mammoth regex
+
+Optional (faster validation of long reference lists):
+    pip install pyahocorasick
 """
 
-import re
+import glob
+import heapq
+import io
 import sys
 from pathlib import Path
-from typing import Set, List, Tuple, Dict
+from typing import FrozenSet, Set, List, Tuple, Dict, Callable, Iterable, Iterator, NamedTuple, Optional
 from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache, partial
+from itertools import islice
 
 
 try:
     import mammoth
+    # Drop-in for re that also supports possessive quantifiers and atomic groups
+    import regex as re
     from docx import Document
 except ImportError:
     print("Error: Required libraries not installed.")
-    print("Please run: pip install python-docx mammoth")
+    print("Please run: pip install python-docx mammoth regex")
     sys.exit(1)
 
+# Optional: faster matching of author-year citations (falls back to a trie-shaped regex)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Style map for minimal_markdown conversions: keep headings (the reference
+# section is found by them) and plain paragraphs, unwrap bold/italic/strikethrough
+_MINIMAL_STYLE_MAP = "\n".join(
+    [f"p[style-name='Heading {n}'] => h{n}:fresh" for n in range(1, 7)]
+    + ["p => p:fresh", "b => ", "i => ", "strike => "]
+)
+
+# Patterns below are compiled once per process and shared by every validator,
+# independent of the regex module's internal cache.
+
+# Common section headers for references, matched against the whole document;
+# [^\S\n] is whitespace other than a newline, so a match stays on one line
+_REF_HEADER_RE = re.compile(
+    r'^#++[^\S\n]*(?>References?|Bibliography|Works?[^\S\n]+Cited|Literature[^\S\n]+Cited)[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+# Leading number of a numbered reference entry: "1. ...", "[1] ...", "1 ..."
+_LEAD_NUM_RE = re.compile(r'^\[?(\d+)\]?\.?\s+')
+
+
+class _PunctuationTable(dict):
+    """
+    str.translate table that deletes everything but word characters and whitespace.
+
+    Equivalent to substituting [^\\w\\s] away, but filled lazily with one entry
+    per distinct code point, so arbitrary Unicode input needs no prebuilt table.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char == '_' or char.isspace() else None
+        self[codepoint] = value
+        return value
+
+
+# Used by ReferenceValidator._normalize_citation
+_PUNCT_TABLE = _PunctuationTable()
+
+
+def _convert(path: str, minimal_markdown: bool) -> Tuple[str, tuple]:
+    """
+    Convert a Word document with mammoth.
+
+    Returns:
+        Tuple of (markdown, conversion_messages)
+    """
+    with open(path, "rb") as docx_file:
+        if minimal_markdown:
+            result = mammoth.convert_to_markdown(
+                docx_file, style_map=_MINIMAL_STYLE_MAP, include_default_style_map=False
+            )
+        else:
+            result = mammoth.convert_to_markdown(docx_file)
+    return result.value, tuple(result.messages)
+
+
+@lru_cache(maxsize=4)
+def _convert_cached(path: str, mtime_ns: int, size: int, minimal_markdown: bool) -> Tuple[str, tuple]:
+    """
+    Memoized _convert, per version of the file.
+
+    The modification time and size are part of the key, so re-validating an
+    unchanged document skips unzipping and parsing it again while an edited
+    one is converted afresh. Kept small, since every entry holds a whole
+    document's markdown.
+    """
+    return _convert(path, minimal_markdown)
+
+
+@lru_cache(maxsize=8)
+def _compile_citation_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Fuse citation patterns into a single alternation.
+
+    Each pattern must have exactly one capturing group (the citation text),
+    with any other grouping written as (?:...), so that the index of the
+    group that matched identifies the pattern. Memoized on the patterns
+    themselves, so a modified pattern list is picked up on the next scan.
+    """
+    for pattern in patterns:
+        if re.compile(pattern).groups != 1:
+            raise ValueError(f"Citation pattern must have exactly one capturing group: {pattern!r}")
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of text one at a time, like text.split('\\n') would."""
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _automaton_finder(words: List[str]) -> Callable[[str], Iterator[str]]:
+    """Return a function yielding every occurrence of the words in a text."""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return lambda text: (word for _, word in automaton.iter(text))
+
+
+def _trie_to_regex(root: dict) -> str:
+    """
+    Render a trie as a regex alternation that shares common prefixes.
+
+    The trie is as deep as the longest citation, which the citation patterns do
+    not bound, so it is walked with an explicit stack instead of recursion.
+    """
+    rendered = {}
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            stack.extend((child, False) for char, child in node.items() if char)
+            continue
+
+        branches = [re.escape(char) + rendered.pop(id(child)) for char, child in sorted(node.items()) if char]
+        if not branches:
+            rendered[id(node)] = ''
+            continue
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        rendered[id(node)] = f'(?:{body})?' if '' in node else body
+    return rendered[id(root)]
+
+
+def _trie_regex_finder(words: List[str]) -> Callable[[str], Iterator[str]]:
+    """
+    Return a function yielding every occurrence of the words in a text.
+
+    Pure-Python fallback for when pyahocorasick is not installed. The words are
+    compiled into a single trie-shaped regex; a lookahead finds the longest word
+    starting at each position, and walking the trie along that hit recovers the
+    shorter words that are its prefixes.
+
+    Empty words are ignored, as the automaton ignores them; callers match
+    those separately. Without this the root would be terminal, the lookahead
+    would match at every position, and the empty word would still never be
+    yielded.
+    """
+    words = [word for word in words if word]
+    if not words:
+        return lambda text: iter(())
+
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = word
+    try:
+        regex = re.compile(f'(?=({_trie_to_regex(trie)}))')
+    except RecursionError:
+        # Thousands of citations nested as prefixes of one another are too deep
+        # for the regex parser; search for each one directly instead
+        return lambda text: (word for word in words if word in text)
+
+    def find(text: str) -> Iterator[str]:
+        for m in regex.finditer(text):
+            node = trie
+            for char in m.group(1):
+                node = node[char]
+                if '' in node:
+                    yield node['']
+
+    return find
+
 
 class ReferenceValidator:
     """Validates inline references against a reference list."""
 
-    # Comprehensive inline citation patterns
+    # Comprehensive inline citation patterns. Runs that can never give back
+    # characters to what follows them are possessive (++) or atomic (?>...),
+    # which bounds backtracking on text that almost looks like a citation.
     CITATION_PATTERNS = [
         # Numeric citations
-        r'\[(\d+)\]',  # [1], [2], etc.
-        r'\^(\d+)',    # ^1, ^2 (superscript in markdown)
-        r'\((\d+)\)',  # (1), (2)
+        r'\[(\d++)\]',  # [1], [2], etc.
+        r'\^(\d++)',    # ^1, ^2 (superscript in markdown)
+        r'\((\d++)\)',  # (1), (2)
 
         # Author-year patterns (various formats)
-        r"\(([A-Z][A-Za-z''\-]+(?:\s+et\s+al\.?)?[,\s]+\d{4}[a-z]?)\)",  # (Author et al., 2020)
-        r"\[([A-Z][A-Za-z''\-]+(?:\s+et\s+al\.?)?[,\s]+\d{4}[a-z]?)\]",  # [Author et al., 2020]
-        r"\(([A-Z][A-Za-z''\-]+\s+and\s+[A-Z][A-Za-z''\-]+[,\s]+\d{4}[a-z]?)\)",  # (Author and Author, 2020)
-        r"\(([A-Z][A-Za-z''\-]+\s+&\s+[A-Z][A-Za-z''\-]+[,\s]+\d{4}[a-z]?)\)",  # (Author & Author, 2020)
-        r"\(([A-Z][A-Za-z''\-]+\s+\d{4}[a-z]?)\)",  # (Author 2020)
-        r"\[([A-Z][A-Za-z''\-]+\s+\d{4}[a-z]?)\]",  # [Author 2020]
+        r"\(([A-Z][A-Za-z''\-]++(?>\s+et\s+al\.?)?[,\s]++\d{4}[a-z]?)\)",  # (Author et al., 2020)
+        r"\[([A-Z][A-Za-z''\-]++(?>\s+et\s+al\.?)?[,\s]++\d{4}[a-z]?)\]",  # [Author et al., 2020]
+        r"\(([A-Z][A-Za-z''\-]++\s+and\s+[A-Z][A-Za-z''\-]++[,\s]++\d{4}[a-z]?)\)",  # (Author and Author, 2020)
+        r"\(([A-Z][A-Za-z''\-]++\s+&\s+[A-Z][A-Za-z''\-]++[,\s]++\d{4}[a-z]?)\)",  # (Author & Author, 2020)
+        r"\(([A-Z][A-Za-z''\-]++\s+\d{4}[a-z]?)\)",  # (Author 2020)
+        r"\[([A-Z][A-Za-z''\-]++\s+\d{4}[a-z]?)\]",  # [Author 2020]
 
         # Multiple authors variations
-        r"\(([A-Z][A-Za-z''\-]+,\s+[A-Z][A-Za-z''\-]+,?\s+(?:and|&)\s+[A-Z][A-Za-z''\-]+[,\s]+\d{4}[a-z]?)\)",  # (A, B, and C, 2020)
+        r"\(([A-Z][A-Za-z''\-]++,\s+[A-Z][A-Za-z''\-]++,?\s+(?:and|&)\s+[A-Z][A-Za-z''\-]++[,\s]++\d{4}[a-z]?)\)",  # (A, B, and C, 2020)
 
         # Author with initials
-        r"\(([A-Z][A-Za-z''\-]+\s+[A-Z]\.(?:\s+[A-Z]\.)?[,\s]+\d{4}[a-z]?)\)",  # (Smith J., 2020)
+        r"\(([A-Z][A-Za-z''\-]++\s+[A-Z]\.(?:\s+[A-Z]\.)?[,\s]++\d{4}[a-z]?)\)",  # (Smith J., 2020)
 
         # Common patterns with "et al"
-        r"\(([A-Z][A-Za-z''\-]+\s+et\s+al\.\s+\d{4}[a-z]?)\)",  # (Smith et al. 2020)
+        r"\(([A-Z][A-Za-z''\-]++\s+et\s+al\.\s+\d{4}[a-z]?)\)",  # (Smith et al. 2020)
     ]
 
-    def __init__(self, docx_path: str, verbose: bool = False):
-        """Initialize validator with a Word document path."""
+    def __init_subclass__(cls, **kwargs):
+        """Check citation patterns of subclasses that override them up front."""
+        super().__init_subclass__(**kwargs)
+        if 'CITATION_PATTERNS' in cls.__dict__:
+            _compile_citation_patterns(tuple(cls.CITATION_PATTERNS))
+
+    def __init__(self, docx_path: str, verbose: bool = False, minimal_markdown: bool = False):
+        """
+        Initialize validator with a Word document path.
+
+        With minimal_markdown, conversion keeps only headings and paragraphs,
+        dropping list, bold and italic markup the validation never looks at.
+        """
         self.docx_path = Path(docx_path)
         self.markdown_content = ""
-        self.inline_refs = []
+        self._inline_refs_set = set()
+        self._sorted_inline_refs = None
         self.reference_list = []
         self.missing_refs = []
         self.verbose = verbose
+        self.minimal_markdown = minimal_markdown
         self.pattern_matches = defaultdict(list)  # Track which patterns matched what
 
-    def convert_to_markdown(self) -> str:
-        """Convert Word document to Markdown format."""
+    @property
+    def inline_refs(self) -> Tuple[str, ...]:
+        """
+        Unique inline references in sorted order (sorted on first access).
+
+        This is a read-only view; assign a new collection to replace the
+        references that validate_references() checks.
+        """
+        if self._sorted_inline_refs is None:
+            self._sorted_inline_refs = tuple(sorted(self._inline_refs_set))
+        return self._sorted_inline_refs
+
+    @inline_refs.setter
+    def inline_refs(self, refs: Iterable[str]) -> None:
+        self._inline_refs_set = set(refs)
+        self._sorted_inline_refs = None
+
+    def convert_to_markdown(self, use_cache: bool = True) -> str:
+        """
+        Convert Word document to Markdown format.
+
+        With use_cache, converting an unchanged document again in the same
+        process reuses the previous result. Callers that convert each document
+        only once should pass use_cache=False to avoid holding its markdown.
+        """
         print(f"Converting {self.docx_path} to Markdown...")
 
         try:
-            with open(self.docx_path, "rb") as docx_file:
-                result = mammoth.convert_to_markdown(docx_file)
-                self.markdown_content = result.value
+            if use_cache:
+                stat = self.docx_path.stat()
+                self.markdown_content, messages = _convert_cached(
+                    str(self.docx_path.resolve()), stat.st_mtime_ns, stat.st_size, self.minimal_markdown
+                )
+            else:
+                self.markdown_content, messages = _convert(str(self.docx_path), self.minimal_markdown)
 
-                if result.messages:
-                    print("Conversion warnings:")
-                    for message in result.messages:
-                        print(f"  - {message}")
+            if self.verbose:
+                print(f"  Markdown size: {len(self.markdown_content)} characters")
+
+            if messages:
+                print("Conversion warnings:")
+                for message in messages:
+                    print(f"  - {message}")
 
             print("✓ Conversion completed successfully")
             return self.markdown_content
@@ -84,74 +319,69 @@ class ReferenceValidator:
             print(f"Error converting document: {e}")
             sys.exit(1)
 
-    def extract_inline_references(self) -> List[str]:
+    def extract_inline_references(self) -> FrozenSet[str]:
         """Extract all inline references from the markdown content."""
         print("\nExtracting inline references...")
 
         inline_refs_set = set()
         self.pattern_matches = defaultdict(list)
 
-        for i, pattern in enumerate(self.CITATION_PATTERNS):
-            matches = re.findall(pattern, self.markdown_content)
-            if matches:
-                if self.verbose:
+        # All citation patterns fused into one alternation so the document is
+        # scanned once; each pattern has a single capture group, so group N is
+        # pattern N-1. Built from the current patterns, compiled once per set.
+        patterns = tuple(self.CITATION_PATTERNS)
+        citation_re = _compile_citation_patterns(patterns)
+
+        # Matches are consumed one at a time; only the citation group is read
+        for m in citation_re.finditer(self.markdown_content):
+            index = m.lastindex
+            match = m.group(index)
+            inline_refs_set.add(match)
+            self.pattern_matches[patterns[index - 1]].append(match)
+
+        if self.verbose:
+            for i, pattern in enumerate(patterns):
+                matches = self.pattern_matches.get(pattern)
+                if matches:
                     print(f"  Pattern {i+1} matched: {len(matches)} citations")
-                for match in matches:
-                    inline_refs_set.add(match)
-                    self.pattern_matches[pattern].append(match)
 
-        self.inline_refs = sorted(list(inline_refs_set))
-        print(f"✓ Found {len(self.inline_refs)} unique inline references")
+        # Kept unordered; the sorted view is only built when something displays it
+        self._inline_refs_set = inline_refs_set
+        self._sorted_inline_refs = None
+        print(f"✓ Found {len(inline_refs_set)} unique inline references")
 
-        if self.verbose and self.inline_refs:
+        if self.verbose and inline_refs_set:
             print("\n  Sample inline references detected:")
-            for ref in list(self.inline_refs)[:10]:
+            for ref in self.inline_refs[:10]:
                 print(f"    - {ref}")
 
-        return self.inline_refs
+        # A snapshot, so changing it cannot desynchronize the sorted view
+        return frozenset(inline_refs_set)
 
     def extract_reference_list(self) -> List[str]:
         """Extract the reference list from the document."""
         print("\nExtracting reference list...")
 
-        # Common section headers for references
-        ref_headers = [
-            r'#+\s*References?\s*$',
-            r'#+\s*Bibliography\s*$',
-            r'#+\s*Works?\s+Cited\s*$',
-            r'#+\s*Literature\s+Cited\s*$',
-        ]
-
         # Find the references section
-        ref_section_start = -1
-        lines = self.markdown_content.split('\n')
-
-        for i, line in enumerate(lines):
-            for header_pattern in ref_headers:
-                if re.match(header_pattern, line, re.IGNORECASE):
-                    ref_section_start = i
-                    if self.verbose:
-                        print(f"  Found reference section at line {i+1}: '{line.strip()}'")
-                    break
-            if ref_section_start != -1:
-                break
-
-        if ref_section_start == -1:
+        header = _REF_HEADER_RE.search(self.markdown_content)
+
+        if header is None:
             print("⚠ Warning: Could not find reference section")
             print("  Looking for sections with headers: References, Bibliography, Works Cited, etc.")
             if self.verbose:
                 print("\n  Showing all lines with '#' (headers) in the document:")
-                for i, line in enumerate(lines):
+                for i, line in enumerate(_iter_lines(self.markdown_content)):
                     if line.strip().startswith('#'):
                         print(f"    Line {i+1}: {line.strip()}")
             return []
 
-        # Extract references from that section onwards
-        reference_lines = lines[ref_section_start + 1:]
+        if self.verbose:
+            line_number = self.markdown_content.count('\n', 0, header.start()) + 1
+            print(f"  Found reference section at line {line_number}: '{header.group().strip()}'")
 
-        # Filter out empty lines and extract references
+        # Extract references from that section onwards, filtering out empty lines
         self.reference_list = [
-            line.strip() for line in reference_lines
+            line.strip() for line in _iter_lines(self.markdown_content[header.end():])
             if line.strip() and not line.strip().startswith('#')
         ]
 
@@ -173,31 +403,35 @@ class ReferenceValidator:
         """
         print("\nValidating references...")
 
-        missing = []
         matched = defaultdict(list)
 
-        for inline_ref in self.inline_refs:
-            found = False
-
-            # Check if inline reference appears in any reference list entry
-            for ref_entry in self.reference_list:
-                # For numeric citations like [1], check if the number matches
-                if inline_ref.isdigit():
-                    # Look for the number at the start of the reference
-                    if re.match(rf'^\[?{inline_ref}\]?\.?\s+', ref_entry):
-                        matched[inline_ref].append(ref_entry)
-                        found = True
-                        break
-                else:
-                    # For author-year citations, check if it appears in the reference
-                    if inline_ref in ref_entry or self._normalize_citation(inline_ref) in self._normalize_citation(ref_entry):
-                        matched[inline_ref].append(ref_entry)
-                        found = True
-                        break
-
-            if not found:
-                missing.append(inline_ref)
-
+        if not self.reference_list:
+            # Nothing to match against (e.g. no reference header was found)
+            missing = sorted(self._inline_refs_set)
+        else:
+            # For author-year citations, check if they appear in any reference.
+            # Each side is normalized once up front rather than once per pair.
+            author_year_refs = [ref for ref in self._inline_refs_set if not ref.isdigit()]
+            if author_year_refs:
+                normalized_inline = [self._normalize_citation(ref) for ref in author_year_refs]
+                normalized_refs = [self._normalize_citation(entry) for entry in self.reference_list]
+                self._match_author_year(author_year_refs, normalized_inline, normalized_refs, matched)
+
+            # For numeric citations like [1], compare the cited numbers with the
+            # numbers the reference entries start with, as sets of digit strings
+            numeric_refs = {ref for ref in self._inline_refs_set if ref.isdigit()}
+
+            if numeric_refs:
+                first_entry_by_number = {}
+                for ref_entry in self.reference_list:
+                    m = _LEAD_NUM_RE.match(ref_entry)
+                    if m:
+                        first_entry_by_number.setdefault(m.group(1), ref_entry)
+
+                for inline_ref in numeric_refs & first_entry_by_number.keys():
+                    matched[inline_ref].append(first_entry_by_number[inline_ref])
+
+            missing = sorted(ref for ref in self._inline_refs_set if ref not in matched)
         self.missing_refs = missing
 
         if missing:
@@ -207,13 +441,45 @@ class ReferenceValidator:
 
         return missing, dict(matched)
 
+    def _match_author_year(self, inline_refs: List[str], normalized_inline: List[str],
+                           normalized_refs: List[str], matched: Dict[str, List[str]]) -> None:
+        """
+        Match author-year citations against the reference list.
+
+        All normalized citations are searched for together, so each reference
+        entry is scanned once (Aho-Corasick if available, otherwise a trie-shaped
+        regex). A raw substring match implies a normalized one, so this covers
+        both the exact and the normalized comparison.
+        """
+        by_normalized = defaultdict(list)
+        for inline_ref, key in zip(inline_refs, normalized_inline):
+            if key:
+                by_normalized[key].append(inline_ref)
+            else:
+                # Nothing left after normalizing (e.g. "{--}" from a custom
+                # pattern): an empty string is in every entry, so the first matches
+                matched[inline_ref].append(self.reference_list[0])
+
+        if not by_normalized:
+            return
+
+        if ahocorasick is not None:
+            find_keys = _automaton_finder(list(by_normalized))
+        else:
+            find_keys = _trie_regex_finder(list(by_normalized))
+
+        for ref_entry, normalized_entry in zip(self.reference_list, normalized_refs):
+            for key in find_keys(normalized_entry):
+                for inline_ref in by_normalized[key]:
+                    # Keep only the first matching entry, as the per-pair scan does
+                    if inline_ref not in matched:
+                        matched[inline_ref].append(ref_entry)
+
     @staticmethod
     def _normalize_citation(text: str) -> str:
         """Normalize citation text for comparison."""
         # Remove punctuation, extra spaces, and convert to lowercase
-        normalized = re.sub(r'[^\w\s]', '', text.lower())
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        return " ".join(text.lower().translate(_PUNCT_TABLE).split())
 
     def generate_report(self) -> str:
         """Generate a detailed validation report."""
@@ -222,18 +488,19 @@ class ReferenceValidator:
         report.append("WORD TO MARKDOWN REFERENCE VALIDATION REPORT")
         report.append("=" * 70)
         report.append(f"\nDocument: {self.docx_path}")
-        report.append(f"Total inline references: {len(self.inline_refs)}")
+        report.append(f"Total inline references: {len(self._inline_refs_set)}")
         report.append(f"Total reference list entries: {len(self.reference_list)}")
         report.append(f"Missing references: {len(self.missing_refs)}")
 
-        if self.inline_refs:
+        if self._inline_refs_set:
             report.append("\n" + "-" * 70)
             report.append("INLINE REFERENCES FOUND:")
             report.append("-" * 70)
-            for ref in self.inline_refs[:20]:  # Show first 20
+            # Show first 20 in sorted order, without sorting the whole set
+            for ref in heapq.nsmallest(20, self._inline_refs_set):
                 report.append(f"  • {ref}")
-            if len(self.inline_refs) > 20:
-                report.append(f"  ... and {len(self.inline_refs) - 20} more")
+            if len(self._inline_refs_set) > 20:
+                report.append(f"  ... and {len(self._inline_refs_set) - 20} more")
 
         if self.missing_refs:
             report.append("\n" + "-" * 70)
@@ -246,7 +513,7 @@ class ReferenceValidator:
             report.append("\n" + "-" * 70)
             report.append("REFERENCE LIST ENTRIES:")
             report.append("-" * 70)
-            for i, ref in enumerate(self.reference_list[:10], 1):  # Show first 10
+            for i, ref in enumerate(islice(self.reference_list, 10), 1):  # Show first 10
                 report.append(f"  {i}. {ref[:100]}{'...' if len(ref) > 100 else ''}")
             if len(self.reference_list) > 10:
                 report.append(f"  ... and {len(self.reference_list) - 10} more")
@@ -262,15 +529,29 @@ class ReferenceValidator:
 
     def save_markdown(self, output_path: str = None) -> Path:
         """Save the converted markdown to a file."""
+        output_path = self._write_markdown(output_path)
+        print(f"✓ Markdown saved to: {output_path}")
+        return output_path
+
+    def save_markdown_async(self, executor: ThreadPoolExecutor, output_path: str = None) -> Future:
+        """
+        Save the converted markdown on an executor thread, without printing.
+
+        Lets the write overlap with reference extraction and validation, which
+        only read the markdown. The future resolves to the saved path and
+        re-raises any write error; the caller prints the confirmation once it
+        has the result, so it does not land in the middle of progress output.
+        """
+        return executor.submit(self._write_markdown, output_path)
+
+    def _write_markdown(self, output_path: str = None) -> Path:
+        """Write the markdown, by default next to the .docx, and return the path."""
         if output_path is None:
             output_path = self.docx_path.with_suffix('.md')
         else:
             output_path = Path(output_path)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(self.markdown_content)
-
-        print(f"✓ Markdown saved to: {output_path}")
+        output_path.write_text(self.markdown_content, encoding='utf-8')
         return output_path
 
     def save_report(self, report_path: str = None) -> Path:
@@ -289,10 +570,78 @@ class ReferenceValidator:
         return report_path
 
 
+class BatchResult(NamedTuple):
+    """Outcome of validating one document in a batch."""
+    docx_path: str
+    missing_refs: List[str]
+    matched_refs: Dict[str, List[str]]
+    error: Optional[str]  # None if the document was processed
+    output: str           # Progress output the worker would have printed
+
+
+def _run_one(docx_path: str, verbose: bool = False, minimal_markdown: bool = False) -> BatchResult:
+    """
+    Run the full pipeline on a single document (batch worker).
+
+    Progress output is captured rather than printed, so parallel workers do not
+    interleave, and failures are returned rather than raised, so one bad
+    document does not end the batch.
+    """
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            validator = ReferenceValidator(docx_path, verbose=verbose, minimal_markdown=minimal_markdown)
+            with ThreadPoolExecutor(max_workers=1) as io_executor:
+                validator.convert_to_markdown(use_cache=False)
+                markdown_saved = validator.save_markdown_async(io_executor)
+                validator.extract_inline_references()
+                validator.extract_reference_list()
+                missing, matched = validator.validate_references()
+                print(f"✓ Markdown saved to: {markdown_saved.result()}")
+                validator.save_report()
+    except (Exception, SystemExit) as e:
+        # convert_to_markdown prints the reason and exits; report that line
+        lines = log.getvalue().strip().splitlines()
+        error = lines[-1] if isinstance(e, SystemExit) and lines else f"{type(e).__name__}: {e}"
+        return BatchResult(docx_path, [], {}, error, log.getvalue())
+    return BatchResult(docx_path, missing, matched, None, log.getvalue())
+
+
+def validate_many(paths: List[str], verbose: bool = False,
+                  minimal_markdown: bool = False) -> List[BatchResult]:
+    """
+    Validate several Word documents in parallel, one worker process each.
+
+    The markdown and validation report of every document are saved next to it.
+
+    Returns:
+        List of BatchResult in input order; documents that could not be
+        processed have their error set
+    """
+    with ProcessPoolExecutor() as executor:
+        worker = partial(_run_one, verbose=verbose, minimal_markdown=minimal_markdown)
+        return list(executor.map(worker, paths))
+
+
+def _collect_batch_paths(target: str) -> List[str]:
+    """Expand a directory or glob pattern into the Word documents it names."""
+    if Path(target).is_dir():
+        paths = Path(target).iterdir()
+    else:
+        paths = (Path(p) for p in glob.glob(target))
+    # Keep only Word documents (not the .md/.txt outputs of an earlier run),
+    # and skip the lock files Word leaves next to open documents
+    return sorted(
+        str(p) for p in paths
+        if p.suffix.lower() == '.docx' and not p.name.startswith('~$') and p.is_file()
+    )
+
+
 def main():
     """Main entry point for the script."""
     if len(sys.argv) < 2:
         print("Usage: python word_to_markdown_validator.py <word_document.docx> [output.md] [--verbose]")
+        print("       python word_to_markdown_validator.py --batch <directory-or-glob> [--verbose]")
         print("\nThis script will:")
         print("  1. Convert the Word document to Markdown")
         print("  2. Extract all inline references")
@@ -302,12 +651,46 @@ def main():
         print("  6. Save the report to a .validation_report.txt file")
         print("\nOptions:")
         print("  --verbose    Show detailed debug information during processing")
+        print("  --batch      Validate every .docx in a directory or glob pattern in parallel")
+        print("  --minimal    Convert only headings and paragraphs (no list/bold/italic markup)")
         sys.exit(1)
 
     # Parse arguments
     verbose = '--verbose' in sys.argv or '-v' in sys.argv
+    batch = '--batch' in sys.argv
+    minimal_markdown = '--minimal' in sys.argv
     args = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
 
+    if batch:
+        paths = _collect_batch_paths(args[0]) if args else []
+        if not paths:
+            print(f"Error: No .docx files found for '{args[0] if args else ''}'")
+            sys.exit(1)
+
+        results = validate_many(paths, verbose=verbose, minimal_markdown=minimal_markdown)
+
+        # Workers run quietly; in verbose mode show each document's log in turn
+        if verbose:
+            for result in results:
+                print(result.output)
+
+        print("\n" + "=" * 70)
+        print(f"BATCH VALIDATION SUMMARY ({len(results)} documents)")
+        print("=" * 70)
+        for result in results:
+            if result.error:
+                status = "✗ failed"
+            elif result.missing_refs:
+                status = f"✗ {len(result.missing_refs)} missing"
+            else:
+                status = "✓ passed"
+            print(f"  {status:<14} {result.docx_path}")
+            if result.error:
+                print(f"  {'':<14} {result.error}")
+
+        passed = all(not result.error and not result.missing_refs for result in results)
+        sys.exit(0 if passed else 1)
+
     docx_path = args[0]
     output_path = args[1] if len(args) > 1 else None
 
@@ -317,27 +700,29 @@ def main():
         sys.exit(1)
 
     # Create validator and run the process
-    validator = ReferenceValidator(docx_path, verbose=verbose)
+    validator = ReferenceValidator(docx_path, verbose=verbose, minimal_markdown=minimal_markdown)
 
-    # Step 1: Convert to markdown
-    validator.convert_to_markdown()
+    with ThreadPoolExecutor(max_workers=1) as io_executor:
+        # Step 1: Convert to markdown, and start saving it in the background
+        validator.convert_to_markdown(use_cache=False)
+        markdown_saved = validator.save_markdown_async(io_executor, output_path)
 
-    # Step 2: Extract inline references
-    validator.extract_inline_references()
+        # Step 2: Extract inline references
+        validator.extract_inline_references()
 
-    # Step 3: Extract reference list
-    validator.extract_reference_list()
+        # Step 3: Extract reference list
+        validator.extract_reference_list()
 
-    # Step 4: Validate references
-    missing, matched = validator.validate_references()
+        # Step 4: Validate references
+        missing, matched = validator.validate_references()
 
-    # Step 5: Generate and display report
-    report = validator.generate_report()
-    print("\n" + report)
+        # Step 5: Generate and display report
+        report = validator.generate_report()
+        print("\n" + report)
 
-    # Step 6: Save files
-    validator.save_markdown(output_path)
-    validator.save_report()
+        # Step 6: Save files
+        print(f"✓ Markdown saved to: {markdown_saved.result()}")
+        validator.save_report()
 
     # Exit with appropriate code
     sys.exit(0 if not missing else 1)